@@ -0,0 +1,55 @@
+"""
+Tests for yield curve metrics.
+"""
+
+import numpy as np
+
+from yieldcurve.models.nss import NSSYieldCurve
+from yieldcurve.models.spline import CubicSplineYieldCurve
+from yieldcurve.utils.metrics import (
+    calculate_forward_rates,
+    calculate_forward_rates_batch,
+    duration_approx,
+)
+
+MODELS = [
+    NSSYieldCurve((4.0, -1.0, -1.0, 1.0, 1.5, 4.0)),
+    NSSYieldCurve((5.0, 1.0, 2.0, -1.0, 0.5, 9.0)),
+]
+
+
+def test_forward_rates_batch_matches_single_models():
+    grid = np.linspace(0.0, 30.0, 61)
+    forwards = calculate_forward_rates_batch(MODELS, grid)
+    assert forwards.shape == (2, 61)
+    for model, row in zip(MODELS, forwards):
+        np.testing.assert_allclose(row, calculate_forward_rates(model, grid), atol=1e-12)
+
+
+def test_forward_rates_batch_empty():
+    assert calculate_forward_rates_batch([], np.linspace(1.0, 10.0, 5)).shape == (0, 5)
+
+
+def test_forward_rates_respects_forward_rate_override():
+    class ShiftedNSS(NSSYieldCurve):
+        def forward_rate(self, t):
+            return super().forward_rate(t) + 1.0
+
+    grid = np.array([1.0, 5.0])
+    model = ShiftedNSS((4.0, -1.0, -1.0, 1.0, 1.5, 4.0))
+    np.testing.assert_allclose(
+        calculate_forward_rates(model, grid), MODELS[0].forward_rate(grid) + 1.0
+    )
+
+
+def test_duration_matches_price_finite_difference():
+    model = CubicSplineYieldCurve({"1Y": 3.65, "2Y": 3.57, "10Y": 4.11})
+    maturities = np.array([1.0, 2.0, 5.0, 10.0])
+
+    y0 = model(maturities)
+    p0 = np.exp(-y0 / 100.0 * maturities)
+    p1 = np.exp(-(y0 + 0.01) / 100.0 * maturities)
+    expected = -(p1 - p0) / 0.01 / p0
+
+    np.testing.assert_allclose(duration_approx(model, maturities), expected, rtol=1e-9)
+    assert isinstance(duration_approx(model, 5.0), float)
@@ -0,0 +1,185 @@
+"""
+Tests for the NSS model: fitting internals, compiled kernels and fallbacks.
+"""
+
+import numpy as np
+import pytest
+
+from yieldcurve.models import nss
+from yieldcurve.models.nss import (
+    NSSYieldCurve,
+    nss_formula,
+    _concentrated_jac,
+    _concentrated_residuals,
+    _lstsq4,
+    _nss_loadings,
+    _seed_costs,
+)
+
+MATURITIES = np.array([1/12, 0.25, 0.5, 1, 2, 3, 5, 7, 10, 20, 30.0])
+LABELS = ["1M", "3M", "6M", "1Y", "2Y", "3Y", "5Y", "7Y", "10Y", "20Y", "30Y"]
+PARAMS = (4.0, -1.0, -1.0, 1.0, 1.5, 4.0)
+
+
+def _curve(params=PARAMS):
+    return dict(zip(LABELS, nss_formula(MATURITIES, *params)))
+
+
+def _sse(model, curve):
+    return np.sum((model(MATURITIES) - np.array(list(curve.values()))) ** 2)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_fit():
+    NSSYieldCurve.reset_warm_start()
+    yield
+    NSSYieldCurve.reset_warm_start()
+
+
+# -----------------------------
+# Concentrated (variable-projection) fit
+# -----------------------------
+@pytest.mark.parametrize("num_curves", [1, 3])
+def test_concentrated_jac_matches_finite_differences(num_curves):
+    # Kaufman's approximation is exact where the residuals vanish, i.e. at
+    # the true τ's of noise-free curves
+    betas = np.array([[4.0, -1.0, -1.0, 1.0], [5.0, 1.0, 2.0, -1.0], [3.0, 0.5, -2.0, 2.0]])
+    tau = np.array([1.5, 4.0])
+    Y = _nss_loadings(MATURITIES, *tau) @ betas[:num_curves].T
+    if num_curves == 1:
+        Y = Y[:, 0]
+
+    h = 1e-6
+    numeric = np.column_stack([
+        (_concentrated_residuals(tau + h * e, MATURITIES, Y)
+         - _concentrated_residuals(tau - h * e, MATURITIES, Y)) / (2 * h)
+        for e in np.eye(2)
+    ])
+    np.testing.assert_allclose(_concentrated_jac(tau, MATURITIES, Y), numeric, atol=1e-7)
+
+
+def test_fit_recovers_exact_curve():
+    model = NSSYieldCurve.fit(_curve())
+    np.testing.assert_allclose(model(MATURITIES), nss_formula(MATURITIES, *PARAMS), atol=1e-6)
+
+
+def test_warm_start_refits_same_curve():
+    curve = _curve()
+    first = NSSYieldCurve.fit(curve)
+    second = NSSYieldCurve.fit(curve)
+    np.testing.assert_allclose(second(MATURITIES), first(MATURITIES), atol=1e-8)
+
+
+def test_warm_start_never_worse_than_best_seed():
+    rng = np.random.default_rng(7)
+    curves = [
+        dict(zip(LABELS, nss_formula(MATURITIES, *p) + rng.normal(0, 0.03, 11)))
+        for p in [(5.0, 1.0, 3.0, -3.0, 0.3, 18.0), (3.0, -2.0, 2.0, 1.0, 2.5, 4.0),
+                  (4.0, 2.0, -4.0, 4.0, 0.8, 10.0)]
+    ]
+    for a in curves:
+        for b in curves:
+            NSSYieldCurve.reset_warm_start()
+            NSSYieldCurve.fit(a)
+            best_seed = _seed_costs(MATURITIES, np.array(list(b.values()))).min()
+            assert _sse(NSSYieldCurve.fit(b), b) <= best_seed * (1 + 1e-9)
+
+
+def test_fit_batch_matches_single_fits():
+    params = [(4.0, -1.0, -1.0, 1.0, 1.5, 4.0), (5.0, 1.0, 2.0, -1.0, 1.5, 4.0)]
+    Y = np.array([nss_formula(MATURITIES, *p) for p in params])
+
+    models = NSSYieldCurve.fit_batch(MATURITIES, Y)
+    assert len(models) == 2
+    for model, y in zip(models, Y):
+        np.testing.assert_allclose(model(MATURITIES), y, atol=1e-6)
+
+    single = NSSYieldCurve.fit_batch(MATURITIES, Y[0])[0]
+    fitted = NSSYieldCurve.fit(dict(zip(LABELS, Y[0])))
+    np.testing.assert_allclose(single(MATURITIES), fitted(MATURITIES), atol=1e-8)
+
+
+def test_fit_batch_rejects_mismatched_shapes():
+    with pytest.raises(ValueError):
+        NSSYieldCurve.fit_batch(MATURITIES, np.ones((2, 5)))
+
+
+# -----------------------------
+# Linear solves
+# -----------------------------
+@pytest.mark.parametrize("rhs_shape", [(11,), (11, 3), (11, 500)])
+def test_lstsq4_matches_lapack(rhs_shape):
+    L = _nss_loadings(MATURITIES, 1.0, 3.0)
+    b = np.random.default_rng(0).random(rhs_shape)
+    np.testing.assert_allclose(_lstsq4(L, b), np.linalg.lstsq(L, b, rcond=None)[0], atol=1e-9)
+
+
+def test_lstsq4_falls_back_on_singular_loadings():
+    # τ1 == τ2 makes the last two loading columns identical
+    L = _nss_loadings(MATURITIES, 2.0, 2.0)
+    b = np.random.default_rng(1).random(11)
+    np.testing.assert_allclose(_lstsq4(L, b), np.linalg.lstsq(L, b, rcond=None)[0], atol=1e-9)
+
+
+@pytest.mark.skipif(not nss.HAVE_NUMBA, reason="numba not installed")
+def test_solve4_detects_singular_matrix():
+    from yieldcurve.models._nss_kernel import solve4
+
+    L = _nss_loadings(MATURITIES, 2.0, 2.0)
+    assert solve4(L.T @ L, L.T @ np.ones(11)) is None
+
+
+# -----------------------------
+# Evaluation paths
+# -----------------------------
+@pytest.mark.parametrize("size", [11, 2000])
+def test_nss_formula_numba_matches_numpy(monkeypatch, size):
+    t = np.linspace(0.0, 30.0, size)
+    t[3] = np.nan
+
+    compiled = nss_formula(t, *PARAMS)
+    monkeypatch.setattr(nss, "HAVE_NUMBA", False)
+    expected = nss_formula(t, *PARAMS)
+
+    assert np.isnan(compiled[3]) and np.isnan(expected[3])
+    np.testing.assert_allclose(compiled, expected, atol=1e-12)
+
+
+@pytest.mark.skipif(not nss.HAVE_NUMEXPR, reason="numexpr not installed")
+def test_nss_formula_numexpr_matches_numpy(monkeypatch):
+    t = np.linspace(0.0, 30.0, nss.NUMEXPR_THRESHOLD + 1)
+    t[3] = np.nan
+
+    monkeypatch.setattr(nss, "HAVE_NUMBA", False)
+    evaluated = nss_formula(t, *PARAMS)
+    monkeypatch.setattr(nss, "HAVE_NUMEXPR", False)
+    expected = nss_formula(t, *PARAMS)
+
+    assert np.isnan(evaluated[3]) and np.isnan(expected[3])
+    np.testing.assert_allclose(evaluated, expected, atol=1e-12)
+
+
+def test_call_matches_formula_with_loadings_cache():
+    model = NSSYieldCurve(PARAMS)
+    t = np.linspace(0.0, 30.0, 300)
+    for _ in range(3):
+        np.testing.assert_allclose(model(t), nss_formula(t, *PARAMS), atol=1e-12)
+
+    model.tau1 = 2.0
+    np.testing.assert_allclose(model(t), nss_formula(t, *PARAMS[:4], 2.0, PARAMS[5]), atol=1e-12)
+
+
+def test_forward_rate_matches_finite_differences():
+    model = NSSYieldCurve(PARAMS)
+    t = np.linspace(0.5, 29.5, 59)
+    h = 1e-5
+    numeric = ((t + h) * model(t + h) - (t - h) * model(t - h)) / (2 * h)
+    np.testing.assert_allclose(model.forward_rate(t), numeric, atol=1e-7)
+
+
+def test_generate_curve_returns_writable_copies():
+    model = NSSYieldCurve(PARAMS)
+    xs, ys = model.generate_curve()
+    ys *= 100
+    _, ys_again = model.generate_curve()
+    np.testing.assert_allclose(ys_again, ys / 100)
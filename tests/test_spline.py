@@ -0,0 +1,48 @@
+"""
+Tests for the cubic spline model.
+"""
+
+from types import MappingProxyType
+
+import numpy as np
+import pytest
+
+from yieldcurve.models.spline import CubicSplineYieldCurve
+
+CURVE = {
+    "1M": 4.02, "3M": 3.93, "6M": 3.80, "1Y": 3.65, "2Y": 3.57, "3Y": 3.60,
+    "5Y": 3.69, "7Y": 3.88, "10Y": 4.11, "20Y": 4.60, "30Y": 4.65,
+}
+
+
+def test_ppoly_evaluation_matches_cubic_spline():
+    model = CubicSplineYieldCurve(CURVE)
+    # Includes the knots themselves and extrapolation past 30Y
+    t = np.concatenate([np.linspace(0.0, 40.0, 4001), model.x])
+    np.testing.assert_allclose(model(t), model.spline(t), atol=1e-12)
+
+
+def test_evaluation_keeps_input_shape():
+    model = CubicSplineYieldCurve(CURVE)
+    assert model(np.ones((2, 3))).shape == (2, 3)
+    assert float(model(5.0)) == pytest.approx(3.69)
+
+
+def test_accepts_any_mapping():
+    model = CubicSplineYieldCurve(MappingProxyType(CURVE))
+    np.testing.assert_allclose(model.y, CubicSplineYieldCurve(CURVE).y)
+
+
+def test_rejects_non_mapping_and_negative_maturity():
+    with pytest.raises(TypeError):
+        CubicSplineYieldCurve([1, 2, 3])
+    with pytest.raises(ValueError):
+        CubicSplineYieldCurve(CURVE)(-1.0)
+
+
+def test_generate_curve_returns_writable_copies():
+    model = CubicSplineYieldCurve(CURVE)
+    xs, ys = model.generate_curve(num=50)
+    ys *= 100
+    _, ys_again = model.generate_curve(num=50)
+    np.testing.assert_allclose(ys_again, ys / 100)
@@ -9,6 +9,7 @@ Cubic Spline and Nelson–Siegel–Svensson models, and visualizing the curve.
 __version__ = "0.1.0"
 
 # Public API
+from .core import YieldCurveData
 from .loader.fred_loader import get_yield_curve
 from .models.spline import CubicSplineYieldCurve
 from .models.nss import NSSYieldCurve
@@ -20,7 +21,7 @@ def fit_spline(curve_dict):
     Fit a cubic spline model to a yield curve.
     
     Args:
-        curve_dict: Dictionary mapping maturity labels to yields
+        curve_dict: Dictionary mapping maturity labels to yields, or a YieldCurveData
     
     Returns:
         CubicSplineYieldCurve: Fitted spline model
@@ -38,7 +39,7 @@ def fit_nss(curve_dict):
     Fit a Nelson–Siegel–Svensson model to a yield curve.
     
     Args:
-        curve_dict: Dictionary mapping maturity labels to yields
+        curve_dict: Dictionary mapping maturity labels to yields, or a YieldCurveData
     
     Returns:
         NSSYieldCurve: Fitted NSS model
@@ -57,6 +58,9 @@ def load_yields():
     
     Returns:
         dict: Dictionary mapping maturity labels to yields
+
+    Raises:
+        RuntimeError: If none of the FRED series could be fetched.
     
     Example:
         >>> from yieldcurve import load_yields
@@ -66,6 +70,7 @@ def load_yields():
 
 
 __all__ = [
+    "YieldCurveData",
     "get_yield_curve",
     "load_yields",
     "CubicSplineYieldCurve",
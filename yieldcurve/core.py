@@ -0,0 +1,83 @@
+"""
+Core Yield Curve Data Container
+-------------------------------
+
+Holds an observed yield curve as parallel arrays (labels, maturities, yields)
+sorted by maturity once, so models and plots don't each re-parse the
+maturity labels of a curve dictionary.
+
+Example:
+    from yieldcurve.core import YieldCurveData
+
+    data = YieldCurveData.from_dict({'10Y': 4.11, '1M': 4.02, '2Y': 3.57})
+    data.maturities   # array([0.0833, 2.0, 10.0])
+    data.yields       # array([4.02, 3.57, 4.11])
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Dict, Union
+
+import numpy as np
+
+from .utils.conversions import maturity_to_years
+
+
+@dataclass(frozen=True, eq=False)
+class YieldCurveData:
+    """
+    Observed yield curve in struct-of-arrays form, sorted by maturity.
+
+    - labels: maturity labels like '3M', '1Y', '10Y'
+    - maturities: maturities in YEARS
+    - yields: annualized percentage yields, e.g., 4.15
+
+    The arrays are read-only so the container can be shared between models.
+    """
+
+    __slots__ = ("labels", "maturities", "yields")
+
+    labels: np.ndarray
+    maturities: np.ndarray
+    yields: np.ndarray
+
+    @classmethod
+    def from_dict(cls, curve_dict: Mapping) -> "YieldCurveData":
+        """
+        curve_dict: {'1M': 4.1, '3M': 4.03, '1Y': 3.77, ..., '30Y': 4.11}
+        """
+        if not isinstance(curve_dict, Mapping):
+            raise TypeError("curve_dict must be a mapping {maturity: yield}")
+
+        labels = np.array(list(curve_dict.keys()), dtype=str)
+        maturities = np.array([maturity_to_years(k) for k in labels], dtype=float)
+        yields = np.array([float(v) for v in curve_dict.values()], dtype=float)
+
+        # Sort by increasing maturity, once
+        order = np.argsort(maturities, kind="stable")
+        labels = labels[order]
+        maturities = maturities[order]
+        yields = yields[order]
+
+        for arr in (labels, maturities, yields):
+            arr.flags.writeable = False
+
+        return cls(labels, maturities, yields)
+
+    @classmethod
+    def from_curve(cls, curve: Union[Mapping, "YieldCurveData"]) -> "YieldCurveData":
+        """
+        Accept either a curve mapping (e.g. a dict) or an existing YieldCurveData.
+        """
+        if isinstance(curve, cls):
+            return curve
+        return cls.from_dict(curve)
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Convert back to a {maturity: yield} dictionary, sorted by maturity.
+        """
+        return {str(k): float(v) for k, v in zip(self.labels, self.yields)}
+
+    def __len__(self) -> int:
+        return len(self.yields)
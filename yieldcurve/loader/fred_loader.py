@@ -1,9 +1,11 @@
 """
 FRED (Federal Reserve Economic Data) loader for yield curve data.
 """
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-import csv
-from io import StringIO
+from requests.adapters import HTTPAdapter
 
 # -----------------------------
 # MATURITY CONVERSION TABLE
@@ -22,6 +24,11 @@ MATURITY_MAP = {
     "30Y": 30
 }
 
+# Rank of each canonical label by maturity, so sorting is a single dict lookup
+_LABEL_ORDER = {
+    label: i for i, label in enumerate(sorted(MATURITY_MAP, key=MATURITY_MAP.get))
+}
+
 # -----------------------------
 # FRED SERIES IDS (H.15 data)
 # -----------------------------
@@ -39,34 +46,91 @@ FRED_SERIES = {
     "30Y": "DGS30"
 }
 
+FRED_CSV_URL = "https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}"
+
+# (connect, read) timeouts in seconds, so a stuck series can't stall the batch
+REQUEST_TIMEOUT = (3, 10)
+
+
+# -----------------------------
+# HTTP SESSION (keep-alive + pooled connections)
+# -----------------------------
+# Shared across calls so connections to FRED stay alive between fetches
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount("https://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
 # -----------------------------
 # FETCH FROM FRED (CSV, NO API KEY)
 # -----------------------------
 def fetch_from_fred():
+    """
+    Download the latest observation of every series in FRED_SERIES.
+
+    Returns:
+        dict: {maturity label: yield}, sorted by maturity. Series that fail
+              or have no valid last observation are left out.
+
+    Raises:
+        RuntimeError: If no series could be fetched at all (chained to the
+                      last network error, if any). Earlier versions returned
+                      an empty dict when every request got a bad response.
+    """
     print("Fetching U.S. Treasury yield curve via FRED (no API key)...\n")
 
-    curve = {}
+    session = _get_session()
+    errors = []
 
-    for label, series_id in FRED_SERIES.items():
-        url = f"https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}"
-        r = requests.get(url)
+    def _fetch_one(label, series_id):
+        url = FRED_CSV_URL.format(series_id=series_id)
+        try:
+            r = session.get(url, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as exc:
+            errors.append(exc)
+            return None
 
         if r.status_code != 200:
-            continue
+            return None
 
-        csv_data = list(csv.reader(StringIO(r.text)))
-        if len(csv_data) < 2:
-            continue
+        # Only the last row is needed: scan back from the end of the body
+        # instead of parsing every historical observation
+        body = r.text.rstrip()
+        newline = body.rfind("\n")
+        if newline == -1:
+            # Header only, no observations
+            return None
 
-        # Last valid row (skips blanks)
-        last_val = csv_data[-1][1]
+        last_line = body[newline + 1:].rstrip()
+        _, _, last_val = last_line.partition(",")
         try:
-            curve[label] = float(last_val)
-        except:
-            continue
+            return label, float(last_val)
+        except ValueError:
+            # FRED marks missing observations with "."
+            return None
+
+    # Downloads are I/O-bound, so run them concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=len(FRED_SERIES)) as executor:
+        results = executor.map(_fetch_one, FRED_SERIES.keys(), FRED_SERIES.values())
+        curve = dict(res for res in results if res is not None)
+
+    if not curve:
+        raise RuntimeError(
+            "Could not fetch any Treasury yield series from FRED"
+        ) from (errors[-1] if errors else None)
 
     # Sort maturities in ascending order
-    curve = dict(sorted(curve.items(), key=lambda x: MATURITY_MAP[x[0]]))
+    curve = dict(sorted(curve.items(), key=lambda x: _LABEL_ORDER[x[0]]))
     return curve
 
 # -----------------------------
@@ -79,6 +143,9 @@ def get_yield_curve():
     Returns:
         dict: Dictionary mapping maturity labels to yields (e.g., {'1M': 4.02, '3M': 3.93, ...})
               Sorted by maturity in ascending order.
+
+    Raises:
+        RuntimeError: If none of the FRED series could be fetched.
     
     Example:
         >>> curve = get_yield_curve()
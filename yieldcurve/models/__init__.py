@@ -3,7 +3,7 @@ Yield curve models.
 """
 
 from .spline import CubicSplineYieldCurve
-from .nss import NSSYieldCurve, nss_formula
+from .nss import NSSYieldCurve, nss_formula, nss_forward_formula
 
-__all__ = ["CubicSplineYieldCurve", "NSSYieldCurve", "nss_formula"]
+__all__ = ["CubicSplineYieldCurve", "NSSYieldCurve", "nss_formula", "nss_forward_formula"]
 
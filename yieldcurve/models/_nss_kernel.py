@@ -0,0 +1,121 @@
+"""
+Compiled NSS Evaluation Kernel
+------------------------------
+
+Numba version of nss_formula that evaluates the whole NSS expression in a
+single loop, without the intermediate NumPy arrays of the vectorized path,
+and an unrolled 4×4 Cholesky solve for the β normal equations of the fit.
+
+Numba is optional: when it is not installed HAVE_NUMBA is False and
+nss.py keeps using the pure-NumPy / LAPACK implementations.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+# Grids at least this large are evaluated with the multithreaded kernel
+PARALLEL_THRESHOLD = 1024
+
+
+if HAVE_NUMBA:
+
+    def _nss_loop(t, beta0, beta1, beta2, beta3, tau1, tau2, out):
+        for i in prange(t.size):
+            # Avoid division by zero for very small t
+            ti = max(t[i], 1e-12)
+
+            u1 = ti / tau1
+            em1 = math.expm1(-u1)
+            f1 = -em1 / u1
+
+            u2 = ti / tau2
+            em2 = math.expm1(-u2)
+            f2 = -em2 / u2
+
+            out[i] = (
+                beta0
+                + beta1 * f1
+                + beta2 * (f1 - em1 - 1.0)
+                + beta3 * (f2 - em2 - 1.0)
+            )
+        return out
+
+    _nss_serial = njit(cache=True, error_model="numpy")(_nss_loop)
+    _nss_parallel = njit(cache=True, error_model="numpy", parallel=True)(_nss_loop)
+
+    def nss_kernel(t, beta0, beta1, beta2, beta3, tau1, tau2, out):
+        """
+        Evaluate NSS yields at the 1-D float64 array t, writing into out.
+        """
+        kernel = _nss_parallel if t.size >= PARALLEL_THRESHOLD else _nss_serial
+        return kernel(t, beta0, beta1, beta2, beta3, tau1, tau2, out)
+
+
+# Right-hand sides at or above this count are solved in parallel
+SOLVE_PARALLEL_THRESHOLD = 256
+
+# Smallest allowed Cholesky pivot, relative to the diagonal entry
+_PIVOT_TOL = 1e-10
+
+
+if HAVE_NUMBA:
+
+    def _solve4_loop(A, B, out):
+        # Cholesky factor of the SPD 4×4 matrix A (lower triangle)
+        C = np.zeros((4, 4))
+        for j in range(4):
+            s = A[j, j]
+            for k in range(j):
+                s -= C[j, k] * C[j, k]
+            if not s > _PIVOT_TOL * A[j, j]:
+                return False
+            C[j, j] = math.sqrt(s)
+            for i in range(j + 1, 4):
+                s = A[i, j]
+                for k in range(j):
+                    s -= C[i, k] * C[j, k]
+                C[i, j] = s / C[j, j]
+
+        # Forward then back substitution, one column of B at a time
+        for col in prange(B.shape[1]):
+            for i in range(4):
+                s = B[i, col]
+                for k in range(i):
+                    s -= C[i, k] * out[k, col]
+                out[i, col] = s / C[i, i]
+            for i in range(3, -1, -1):
+                s = out[i, col]
+                for k in range(i + 1, 4):
+                    s -= C[k, i] * out[k, col]
+                out[i, col] = s / C[i, i]
+        return True
+
+    _solve4_serial = njit(cache=True)(_solve4_loop)
+    _solve4_parallel = njit(cache=True, parallel=True)(_solve4_loop)
+
+    def solve4(A, B):
+        """
+        Solve A @ X = B for a symmetric positive-definite 4×4 A (e.g. the
+        normal equations L.T @ L) by an unrolled Cholesky factorization.
+        B has shape (4,) or (4, K).
+
+        Returns X with the shape of B, or None if A is not numerically
+        positive definite.
+        """
+        B2 = np.ascontiguousarray(B, dtype=np.float64).reshape(4, -1)
+        out = np.empty_like(B2)
+        kernel = (
+            _solve4_parallel if B2.shape[1] >= SOLVE_PARALLEL_THRESHOLD
+            else _solve4_serial
+        )
+        if not kernel(np.ascontiguousarray(A, dtype=np.float64), B2, out):
+            return None
+        return out.reshape(np.shape(B))
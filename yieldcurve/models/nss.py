@@ -32,43 +32,274 @@ Example:
     print(model(5))  # yield at 5Y
 """
 
+from typing import Optional
+
 import numpy as np
-from scipy.optimize import curve_fit
+from scipy.optimize import least_squares
 
+from ..core import YieldCurveData
+from ._nss_kernel import HAVE_NUMBA
 
-# -----------------------------
-# Helpers
-# -----------------------------
-def _maturity_to_years(tag: str) -> float:
-    tag = tag.upper().strip()
-    if tag.endswith("M"):
-        return float(tag[:-1]) / 12.0
-    elif tag.endswith("Y"):
-        return float(tag[:-1])
-    raise ValueError(f"Unknown maturity tag: {tag}")
+if HAVE_NUMBA:
+    from ._nss_kernel import nss_kernel, solve4
+
+try:
+    import numexpr
+    HAVE_NUMEXPR = True
+except ImportError:
+    HAVE_NUMEXPR = False
+
+
+# Closed-form NSS for numexpr, which evaluates it in blocks without
+# full-size temporaries; uses e = expm1(-u) + 1 and f = -expm1(-u) / u.
+# Only used without Numba, whose kernel is faster on grids of any size
+_NSS_EXPR = (
+    "beta0"
+    " + (beta1 + beta2) * (-expm1(-t / tau1) / (t / tau1))"
+    " - beta2 * (expm1(-t / tau1) + 1)"
+    " + beta3 * (-expm1(-t / tau2) / (t / tau2) - expm1(-t / tau2) - 1)"
+)
+
+# Below this many points numexpr's setup cost outweighs its gains
+NUMEXPR_THRESHOLD = 4096
 
 
 # -----------------------------
 # NSS Equation
 # -----------------------------
+def _decay_terms(t, tau):
+    """
+    Shared pieces of the NSS loadings for one decay factor:
+        u = t/τ,  e = exp(-u),  f = (1 - e) / u
+    One expm1 per call; expm1 keeps (1 - e) accurate as u -> 0.
+    """
+    u = t / tau
+    em = np.expm1(-u)
+    return u, em + 1.0, -em / u
+
+
 def nss_formula(t, beta0, beta1, beta2, beta3, tau1, tau2):
     t = np.asarray(t, dtype=float)
 
+    # Arrays go through the compiled kernel when Numba is available
+    if HAVE_NUMBA and t.ndim > 0:
+        t = np.ascontiguousarray(t)
+        out = np.empty_like(t)
+        nss_kernel(
+            t.ravel(),
+            float(beta0), float(beta1), float(beta2), float(beta3),
+            float(tau1), float(tau2),
+            out.ravel()
+        )
+        return out
+
     # Avoid division by zero for very small t
-    t = np.where(t == 0, 1e-6, t)
+    t = np.maximum(t, 1e-12)
+
+    # Without Numba, large grids go through numexpr when available
+    if HAVE_NUMEXPR and t.size >= NUMEXPR_THRESHOLD:
+        return numexpr.evaluate(_NSS_EXPR, local_dict={
+            "t": t,
+            "beta0": float(beta0), "beta1": float(beta1),
+            "beta2": float(beta2), "beta3": float(beta3),
+            "tau1": float(tau1), "tau2": float(tau2),
+        })
+
+    _, e1, f1 = _decay_terms(t, tau1)
+    _, e2, f2 = _decay_terms(t, tau2)
+
+    return beta0 + beta1 * f1 + beta2 * (f1 - e1) + beta3 * (f2 - e2)
+
+
+def nss_forward_formula(t, beta0, beta1, beta2, beta3, tau1, tau2):
+    """
+    Instantaneous forward rate f(t) = y(t) + t * y'(t) of the NSS curve.
+
+    Differentiating t * y(t) analytically gives
+        f(t) = β0 + β1 * e1 + β2 * u1 * e1 + β3 * u2 * e2
+    with u = t/τ and e = exp(-u).
+    """
+    t = np.maximum(np.asarray(t, dtype=float), 1e-12)
+
+    u1, e1, _ = _decay_terms(t, tau1)
+    u2, e2, _ = _decay_terms(t, tau2)
+
+    return beta0 + (beta1 + beta2 * u1) * e1 + beta3 * u2 * e2
+
+
+def _nss_loadings(t, tau1, tau2):
+    """
+    NSS loading matrix [1, f1, f1 - e1, f2 - e2], shape (N, 4).
+    The model is linear in (β0, β1, β2, β3) once τ1, τ2 are fixed.
+    """
+    t = np.maximum(np.asarray(t, dtype=float), 1e-12)
+
+    _, e1, f1 = _decay_terms(t, tau1)
+    _, e2, f2 = _decay_terms(t, tau2)
+
+    return np.column_stack([np.ones_like(t), f1, f1 - e1, f2 - e2])
 
-    term1 = (1 - np.exp(-t / tau1)) / (t / tau1)
-    term2 = term1 - np.exp(-t / tau1)
 
-    term3 = (1 - np.exp(-t / tau2)) / (t / tau2)
-    term4 = term3 - np.exp(-t / tau2)
+def _tau_derivatives(t, tau1, tau2):
+    """
+    τ-derivatives of the loadings that depend on τ. With u = t/τ:
+        df/dτ = (f - e)/τ  and  d(f - e)/dτ = (f - e - u*e)/τ
+
+    Returns: (df1/dτ1, d(f1 - e1)/dτ1, d(f2 - e2)/dτ2), each shape (N,)
+    """
+    t = np.maximum(np.asarray(t, dtype=float), 1e-12)
 
-    return beta0 + beta1 * term1 + beta2 * term2 + beta3 * term4
+    u1, e1, f1 = _decay_terms(t, tau1)
+    u2, e2, f2 = _decay_terms(t, tau2)
+
+    g1 = f1 - e1
+    g2 = f2 - e2
+    return g1 / tau1, (g1 - u1 * e1) / tau1, (g2 - u2 * e2) / tau2
+
+
+def _solve_betas(t, y, tau1, tau2):
+    """
+    Closed-form least-squares β's for fixed (τ1, τ2).
+    y is one curve, shape (N,), or a stack of curves, shape (N, D).
+
+    Returns: (loadings, betas) with betas of shape (4,) or (4, D)
+    """
+    L = _nss_loadings(t, tau1, tau2)
+    return L, _lstsq4(L, y)
+
+
+def _lstsq4(L, b):
+    """
+    Least-squares solution of L @ x = b for the (N, 4) loading matrix L.
+
+    With Numba the 4×4 normal equations are solved by the compiled Cholesky
+    kernel, avoiding LAPACK call overhead on these tiny systems; LAPACK's
+    lstsq remains the fallback, including for (near-)singular loadings
+    such as τ1 ≈ τ2.
+    """
+    if HAVE_NUMBA:
+        x = solve4(L.T @ L, L.T @ b)
+        if x is not None:
+            return x
+    return np.linalg.lstsq(L, b, rcond=None)[0]
+
+
+# -----------------------------
+# Fit over (τ1, τ2) with the β's concentrated out
+# -----------------------------
+# Decay bounds (keeps optimizer stable)
+_TAU_BOUNDS = ([0.01, 0.01], [50, 50])
+
+
+def _concentrated_residuals(tau, t, y):
+    L, beta = _solve_betas(t, y, tau[0], tau[1])
+    return (L @ beta - y).ravel()
+
+
+def _concentrated_jac(tau, t, y):
+    # Kaufman's variable-projection approximation: (dL/dτ) @ β for each
+    # curve, projected off the span of the loadings
+    L, beta = _solve_betas(t, y, tau[0], tau[1])
+    df1, dg1, dg2 = _tau_derivatives(t, tau[0], tau[1])
+
+    J = np.stack([
+        np.multiply.outer(df1, beta[1]) + np.multiply.outer(dg1, beta[2]),
+        np.multiply.outer(dg2, beta[3]),
+    ], axis=-1)
+
+    J = J.reshape(len(t), -1)
+    J = J - L @ _lstsq4(L, J)
+    return J.reshape(-1, 2)
+
+
+def _fit_taus(t, y, start_tau):
+    return least_squares(
+        _concentrated_residuals,
+        x0=start_tau,
+        jac=_concentrated_jac,
+        bounds=_TAU_BOUNDS,
+        method="trf",
+        x_scale="jac",
+        args=(t, y)
+    )
+
+
+# (τ1, τ2) grid used to seed the fit: every pair of _TAU_AXIS values with
+# τ1 < τ2 by convention
+_TAU_AXIS = np.geomspace(0.1, 30.0, 48)
+_TAU_I1, _TAU_I2 = np.triu_indices(len(_TAU_AXIS), k=1)
+_TAU_SEEDS = np.column_stack([_TAU_AXIS[_TAU_I1], _TAU_AXIS[_TAU_I2]])
+
+# Columns of the basis [1, f(τ), f(τ) - e(τ)] over _TAU_AXIS that make up
+# the loading matrix of each seed
+_SEED_COLUMNS = np.column_stack([
+    np.zeros_like(_TAU_I1),
+    1 + _TAU_I1,
+    1 + len(_TAU_AXIS) + _TAU_I1,
+    1 + len(_TAU_AXIS) + _TAU_I2,
+])
+
+# Most seeds tried before giving up on a search that ends on a τ bound
+_MAX_STARTS = 3
+
+
+def _seed_costs(t, y):
+    """
+    Concentrated sum of squared residuals at every seed in _TAU_SEEDS.
+
+    All seeds draw their loadings from one basis over _TAU_AXIS, so the 4×4
+    normal equations of every seed are slices of a single Gram matrix and
+    are solved together.
+    """
+    t = np.maximum(np.asarray(t, dtype=float), 1e-12)
+    Y = y.reshape(len(t), -1)
+
+    _, e, f = _decay_terms(t[:, None], _TAU_AXIS)
+    basis = np.column_stack([np.ones_like(t), f, f - e])
+    gram = basis.T @ basis
+    rhs = basis.T @ Y
+
+    A = gram[_SEED_COLUMNS[:, :, None], _SEED_COLUMNS[:, None, :]]
+    c = rhs[_SEED_COLUMNS]
+    try:
+        b = np.linalg.solve(A, c)
+    except np.linalg.LinAlgError:
+        # Fewer maturities than loadings: take the minimum-norm β's
+        b = np.linalg.pinv(A) @ c
+
+    # |y - Lβ|² expanded, so no residual vectors are formed
+    sse = (
+        np.sum(Y * Y)
+        - 2 * np.einsum("pkd,pkd->p", b, c)
+        + np.einsum("pkd,pkl,pld->p", b, A, b)
+    )
+    return np.where(np.isfinite(sse), sse, np.inf)
+
+
+def _grid_fit(t, y, seed_costs=None):
+    # The τ surface can have local minima, so the search starts from the
+    # best seed of a fine grid, which usually lies in the global basin.
+    # The next seeds are tried only if the search fails or ends on a bound
+    if seed_costs is None:
+        seed_costs = _seed_costs(t, y)
+
+    best = None
+    for k in np.argsort(seed_costs)[:_MAX_STARTS]:
+        result = _fit_taus(t, y, _TAU_SEEDS[k])
+        if best is None or result.cost < best.cost:
+            best = result
+        if result.success and not np.any(result.active_mask):
+            break
+    return best
 
 
 # -----------------------------
 # NSS Model Class
 # -----------------------------
+# Largest grid (in bytes) whose loading matrix NSSYieldCurve.__call__ caches
+_LOADINGS_CACHE_BYTES = 4096
+
+
 class NSSYieldCurve:
     """
     Fits and evaluates the Nelson–Siegel–Svensson yield curve model.
@@ -76,20 +307,64 @@ class NSSYieldCurve:
     Usage:
         model = NSSYieldCurve.fit(curve_dict)
         model(2.5)  # return the yield at 2.5 years
+
+    Successive fits start from the previous solution and fall back to the
+    grid search only when a grid seed fits better than that warm start;
+    call NSSYieldCurve.reset_warm_start() to fit from scratch.
     """
 
+    # Parameters of the last successful fit, reused as the next starting point
+    _last_params: Optional[np.ndarray] = None
+
     def __init__(self, params):
         """
         params: (beta0, beta1, beta2, beta3, tau1, tau2)
         """
         self.beta0, self.beta1, self.beta2, self.beta3, self.tau1, self.tau2 = params
 
+        # (grid/parameter key, xs, ys) of the last generate_curve() call
+        self._curve_cache = None
+
+        # (key, loading matrix) of the last small grid passed to __call__. The
+        # matrix depends only on the grid and τ's, so re-evaluating skips all
+        # exponentials; it is built only once the same grid is seen twice
+        self._loadings_cache = None
+
     # ---------------------------------------------------------
     # Model evaluation
     # ---------------------------------------------------------
     def __call__(self, t):
+        t = np.asarray(t, dtype=float)
+
+        if t.ndim > 0 and 0 < t.nbytes <= _LOADINGS_CACHE_BYTES:
+            key = (t.shape, t.tobytes(), self.tau1, self.tau2)
+
+            # Read and replace the cache as one (key, L) tuple so concurrent
+            # calls never pair one grid's key with another grid's matrix
+            cache = self._loadings_cache
+            if cache is not None and cache[0] == key:
+                L = cache[1]
+                if L is None:
+                    # Second call on this grid: worth building the matrix now
+                    L = _nss_loadings(t.ravel(), self.tau1, self.tau2)
+                    self._loadings_cache = (key, L)
+
+                betas = np.array([self.beta0, self.beta1, self.beta2, self.beta3])
+                return (L @ betas).reshape(t.shape)
+
+            # First sight of this grid: remember it, but evaluate directly
+            self._loadings_cache = (key, None)
+
         return nss_formula(t, self.beta0, self.beta1, self.beta2, self.beta3, self.tau1, self.tau2)
 
+    def forward_rate(self, t):
+        """
+        Instantaneous forward rate at maturity t (float or array, in YEARS).
+        """
+        return nss_forward_formula(
+            t, self.beta0, self.beta1, self.beta2, self.beta3, self.tau1, self.tau2
+        )
+
     # ---------------------------------------------------------
     # Fit NSS from dictionary
     # ---------------------------------------------------------
@@ -97,51 +372,98 @@ class NSSYieldCurve:
     def fit(cls, curve_dict):
         """
         curve_dict: {'1M': 4.1, '3M': 4.03, '1Y': 3.77, ..., '30Y': 4.11}
+                    or a YieldCurveData
 
         Returns: NSSYieldCurve instance
         """
-        maturities = np.array([_maturity_to_years(k) for k in curve_dict.keys()])
-        yields = np.array([float(v) for v in curve_dict.values()])
-
-        # Sort by maturity
-        idx = np.argsort(maturities)
-        x = maturities[idx]
-        y = yields[idx]
-
-        # Initial parameter guess (important for convergence)
-        start_params = [
-            y[-1],        # beta0: long-term level
-            y[0] - y[-1], # beta1: slope
-            -1.0,         # beta2: curvature
-            1.0,          # beta3: curvature 2
-            1.0,          # tau1
-            3.0           # tau2
-        ]
-
-        # Parameter bounds (keeps optimizer stable)
-        bounds = (
-            [-10, -20, -20, -20, 0.01, 0.01],
-            [20, 20, 20, 20, 50, 50]
-        )
-
-        # Fit parameters
-        params, _ = curve_fit(
-            nss_formula,
-            x,
-            y,
-            p0=start_params,
-            bounds=bounds,
-            maxfev=20000
-        )
+        data = YieldCurveData.from_curve(curve_dict)
+        x = data.maturities
+        y = data.yields
+
+        # The β's are solved in closed form for each candidate (τ1, τ2),
+        # so the optimizer only searches the 2-D decay space.
+        # Start from the previous fit's τ's; the grid search only runs if
+        # the best grid seed already fits better than that warm solution
+        seed_costs = _seed_costs(x, y)
+        result = None
+
+        last = cls._last_params
+        if last is not None and last.shape == (6,):
+            warm = _fit_taus(x, y, last[4:])
+            # least_squares reports half the sum of squares
+            if warm.success and 2 * warm.cost <= seed_costs.min():
+                result = warm
+
+        if result is None:
+            result = _grid_fit(x, y, seed_costs)
+
+        # Recover the β's at the optimum
+        tau1, tau2 = result.x
+        _, beta = _solve_betas(x, y, tau1, tau2)
+        params = np.array([*beta, tau1, tau2])
+
+        if result.success:
+            cls._last_params = params
 
         return cls(params)
 
+    @classmethod
+    def fit_batch(cls, maturities, yields_matrix):
+        """
+        Fit a stack of curves observed on the same maturities, e.g. one
+        curve per date. The decay parameters (τ1, τ2) are shared across
+        curves, as in dynamic Nelson–Siegel, so the β's of every curve come
+        from a single linear solve per candidate τ.
+
+        maturities: array of shape (N,), in YEARS
+        yields_matrix: array of shape (D, N), one curve per row
+
+        Returns: list of D NSSYieldCurve instances
+        """
+        x = np.asarray(maturities, dtype=float)
+        Y = np.atleast_2d(np.asarray(yields_matrix, dtype=float))
+        if x.ndim != 1 or Y.ndim != 2 or Y.shape[1] != x.size:
+            raise ValueError(
+                f"yields_matrix must have shape (D, {x.size}), got {Y.shape}"
+            )
+
+        # Columns are curves, so residuals and β's stack per curve
+        Yt = Y.T
+        result = _grid_fit(x, Yt)
+
+        tau1, tau2 = result.x
+        _, betas = _solve_betas(x, Yt, tau1, tau2)
+        return [cls(np.array([*beta, tau1, tau2])) for beta in betas.T]
+
+    @classmethod
+    def reset_warm_start(cls):
+        """
+        Forget the previous solution so the next fit starts from scratch.
+        """
+        cls._last_params = None
+
     # ---------------------------------------------------------
     # Utility: Produce smooth curve for plotting
     # ---------------------------------------------------------
     def generate_curve(self, min_t=0.0, max_t=30.0, num=300):
+        """
+        Returns (xs, ys) on an evenly spaced grid. The curve is cached per
+        grid; each call returns fresh copies.
+        """
+        # Start just above zero so the t -> 0 guard in nss_formula is never hit
+        min_t = max(min_t, 1e-9)
+
+        key = (min_t, max_t, num, self.beta0, self.beta1, self.beta2,
+               self.beta3, self.tau1, self.tau2)
+        cache = self._curve_cache
+        if cache is not None and cache[0] == key:
+            return cache[1].copy(), cache[2].copy()
+
         xs = np.linspace(min_t, max_t, num)
         ys = self(xs)
+
+        # Single assignment, so the key and arrays are always swapped together
+        self._curve_cache = (key, xs.copy(), ys.copy())
         return xs, ys
 
     # ---------------------------------------------------------
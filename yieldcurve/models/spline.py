@@ -22,19 +22,7 @@ Example:
 import numpy as np
 from scipy.interpolate import CubicSpline
 
-
-# -----------------------------
-# Helpers
-# -----------------------------
-def _maturity_to_years(tag: str) -> float:
-    """Converts maturities like '1M', '6M', '1Y', '10Y' -> years."""
-    tag = tag.upper().strip()
-    if tag.endswith("M"):
-        return float(tag[:-1]) / 12.0
-    elif tag.endswith("Y"):
-        return float(tag[:-1])
-    else:
-        raise ValueError(f"Unknown maturity format: {tag}")
+from ..core import YieldCurveData
 
 
 # -----------------------------
@@ -55,23 +43,25 @@ class CubicSplineYieldCurve:
 
     def __init__(self, curve_dict):
         """
-        curve_dict: dict like {'1M': 4.12, '3M': 4.05, '1Y': 3.60, '10Y': 4.12}
+        curve_dict: mapping like {'1M': 4.12, '3M': 4.05, '1Y': 3.60, '10Y': 4.12}
+                    or a YieldCurveData
         """
-        if not isinstance(curve_dict, dict):
-            raise TypeError("curve_dict must be a dict {maturity: yield}")
-
-        # Convert maturities -> years
-        maturities = np.array([_maturity_to_years(k) for k in curve_dict.keys()])
-        yields = np.array([float(v) for v in curve_dict.values()])
-
-        # Sort by increasing maturity
-        order = np.argsort(maturities)
-        self.x = maturities[order]
-        self.y = yields[order]
+        # Maturities in years, sorted by increasing maturity. from_curve
+        # raises TypeError for anything but a mapping or YieldCurveData
+        data = YieldCurveData.from_curve(curve_dict)
+        self.x = data.maturities
+        self.y = data.yields
 
         # Fit the cubic spline
         self.spline = CubicSpline(self.x, self.y, bc_type='natural')
 
+        # Piecewise-polynomial coefficients, shape (4, n-1), highest power first
+        self._x = self.spline.x
+        self._c = self.spline.c
+
+        # (grid key, xs, ys) of the last generate_curve() call
+        self._curve_cache = None
+
     # ---------------------------------------------------------
     # Evaluation
     # ---------------------------------------------------------
@@ -82,7 +72,18 @@ class CubicSplineYieldCurve:
         t = np.asarray(t, dtype=float)
         if np.any(t < 0):
             raise ValueError("Maturity must be >= 0")
-        return self.spline(t)
+        return self._eval(t)
+
+    def _eval(self, t):
+        """
+        Evaluate the fitted polynomial pieces directly (bisection + Horner),
+        extrapolating with the end pieces like CubicSpline does.
+        """
+        idx = np.searchsorted(self._x, t, side="right") - 1
+        idx = np.clip(idx, 0, len(self._x) - 2)
+        dx = t - self._x[idx]
+        c = self._c[:, idx]
+        return ((c[0] * dx + c[1]) * dx + c[2]) * dx + c[3]
 
     # ---------------------------------------------------------
     # Utility: generate smooth curve
@@ -93,9 +94,19 @@ class CubicSplineYieldCurve:
             returns (xs, ys)
             xs: evenly spaced maturities between min(x) and max(x)
             ys: spline yields
+
+        The curve is cached per grid; each call returns fresh copies.
         """
-        xs = np.linspace(self.x.min(), self.x.max(), num)
+        key = (self.x[0], self.x[-1], num)
+        cache = self._curve_cache
+        if cache is not None and cache[0] == key:
+            return cache[1].copy(), cache[2].copy()
+
+        xs = np.linspace(self.x[0], self.x[-1], num)
         ys = self(xs)
+
+        # Single assignment, so the key and arrays are always swapped together
+        self._curve_cache = (key, xs.copy(), ys.copy())
         return xs, ys
 
     # ---------------------------------------------------------
@@ -24,21 +24,18 @@ Example:
     plot_yield_curves(curve, spline_model=spline, nss_model=nss)
 """
 
-import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 
+from ..core import YieldCurveData
 
-# -----------------------------
-# Helper: convert '1M', '2Y', etc. → years
-# -----------------------------
-def _maturity_to_years(tag: str) -> float:
-    tag = tag.upper().strip()
-    if tag.endswith("M"):
-        return float(tag[:-1]) / 12.0
-    elif tag.endswith("Y"):
-        return float(tag[:-1])
-    else:
-        raise ValueError(f"Unknown maturity format: {tag}")
+
+# Backends that render to files only; plt.show() does nothing useful there
+_NON_INTERACTIVE_BACKENDS = {"agg", "cairo", "pdf", "pgf", "ps", "svg", "template"}
+
+# Default PNG resolution; other formats keep 300 DPI for rasterized artists
+PNG_DPI = 150
+DEFAULT_DPI = 300
 
 
 # -----------------------------
@@ -51,57 +48,73 @@ def plot_yield_curves(
     title="Yield Curve Models",
     save_path=None,
     show=True,
-    num_points=300
+    num_points=300,
+    ax=None,
+    dpi=None
 ):
     """
-    curve_dict: observed yields, e.g. {'1M': 4.0, '3M': 3.9, '1Y': 3.5, ...}
+    curve_dict: observed yields, e.g. {'1M': 4.0, '3M': 3.9, '1Y': 3.5, ...},
+                or a YieldCurveData
     spline_model: instance of CubicSplineYieldCurve
     nss_model: instance of NSSYieldCurve
-    """
+    ax: existing matplotlib Axes to draw on; a new figure is created if None
+    dpi: resolution for save_path (default: 150 for .png, 300 otherwise)
 
-    # Convert maturities → years
-    xs_raw = np.array([_maturity_to_years(k) for k in curve_dict.keys()])
-    ys_raw = np.array([float(v) for v in curve_dict.values()])
+    Figures created here are closed after saving unless they are shown, so
+    headless batch runs don't accumulate open figures.
+    """
 
-    # Sort raw values
-    idx = np.argsort(xs_raw)
-    xs_raw = xs_raw[idx]
-    ys_raw = ys_raw[idx]
+    # Maturities in years, sorted
+    data = YieldCurveData.from_curve(curve_dict)
+    xs_raw = data.maturities
+    ys_raw = data.yields
 
-    # Prepare figure
-    plt.figure(figsize=(12, 7))
+    # Prepare figure (only when no Axes was passed in)
+    owns_figure = ax is None
+    if owns_figure:
+        fig, ax = plt.subplots(figsize=(12, 7))
+    else:
+        fig = ax.figure
 
     # Plot raw observed yields
-    plt.scatter(xs_raw, ys_raw, color="black", label="Observed Points", s=55, zorder=5)
+    ax.scatter(xs_raw, ys_raw, color="black", label="Observed Points", s=55, zorder=5)
 
     # Plot spline model
     if spline_model is not None:
-        xs_spline = np.linspace(xs_raw.min(), xs_raw.max(), num_points)
-        ys_spline = spline_model(xs_spline)
-        plt.plot(xs_spline, ys_spline, label="Cubic Spline", linewidth=2.5, color="blue")
+        xs_spline, ys_spline = spline_model.generate_curve(num=num_points)
+        ax.plot(xs_spline, ys_spline, label="Cubic Spline", linewidth=2.5, color="blue",
+                rasterized=True)
 
     # Plot NSS model
     if nss_model is not None:
-        xs_nss = np.linspace(xs_raw.min(), xs_raw.max(), num_points)
-        ys_nss = nss_model(xs_nss)
-        plt.plot(xs_nss, ys_nss, label="NSS", linewidth=2.5, linestyle="--", color="red")
+        xs_nss, ys_nss = nss_model.generate_curve(
+            min_t=xs_raw[0], max_t=xs_raw[-1], num=num_points
+        )
+        ax.plot(xs_nss, ys_nss, label="NSS", linewidth=2.5, linestyle="--", color="red",
+                rasterized=True)
 
     # Labels + styles
-    plt.title(title, fontsize=16, fontweight="bold")
-    plt.xlabel("Maturity (Years)", fontsize=14)
-    plt.ylabel("Yield (%)", fontsize=14)
+    ax.set_title(title, fontsize=16, fontweight="bold")
+    ax.set_xlabel("Maturity (Years)", fontsize=14)
+    ax.set_ylabel("Yield (%)", fontsize=14)
 
-    plt.grid(True, alpha=0.3)
-    plt.legend(fontsize=13)
-    plt.tight_layout()
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=13)
+    if owns_figure:
+        fig.tight_layout()
 
     # Save to file
     if save_path is not None:
-        plt.savefig(save_path, dpi=300)
+        if dpi is None:
+            dpi = PNG_DPI if str(save_path).lower().endswith(".png") else DEFAULT_DPI
+        fig.savefig(save_path, dpi=dpi)
 
-    # Show
-    if show:
+    # Show (skipped on file-only backends such as Agg)
+    headless = matplotlib.get_backend().lower() in _NON_INTERACTIVE_BACKENDS
+    if show and not headless:
         plt.show()
+    elif owns_figure:
+        # Free the figure's pixel buffers
+        plt.close(fig)
 
     return True
-
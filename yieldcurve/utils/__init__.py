@@ -7,6 +7,7 @@ from .metrics import (
     calculate_slope,
     calculate_curvature,
     calculate_forward_rates,
+    calculate_forward_rates_batch,
     duration_approx
 )
 
@@ -17,6 +18,7 @@ __all__ = [
     "calculate_slope",
     "calculate_curvature",
     "calculate_forward_rates",
+    "calculate_forward_rates_batch",
     "duration_approx",
 ]
 
@@ -7,6 +7,15 @@ Helper functions for converting between maturity formats and sorting yield curve
 
 from typing import Dict
 
+from ..loader.fred_loader import MATURITY_MAP, _LABEL_ORDER
+
+
+# Canonical tags (either case) -> years, checked before parsing the tag
+_FAST = {
+    **{k: float(v) for k, v in MATURITY_MAP.items()},
+    **{k.lower(): float(v) for k, v in MATURITY_MAP.items()},
+}
+
 
 def maturity_to_years(tag: str) -> float:
     """
@@ -27,6 +36,11 @@ def maturity_to_years(tag: str) -> float:
         >>> maturity_to_years('10Y')
         10.0
     """
+    try:
+        return _FAST[tag]
+    except KeyError:
+        pass
+
     tag = tag.upper().strip()
     if tag.endswith("M"):
         return float(tag[:-1]) / 12.0
@@ -89,5 +103,9 @@ def sort_curve_dict(curve_dict: Dict[str, float]) -> Dict[str, float]:
     if not isinstance(curve_dict, dict):
         raise TypeError("curve_dict must be a dictionary")
     
-    return dict(sorted(curve_dict.items(), key=lambda x: maturity_to_years(x[0])))
+    try:
+        return dict(sorted(curve_dict.items(), key=lambda x: _LABEL_ORDER[x[0]]))
+    except KeyError:
+        # Non-canonical labels present: fall back to parsing every tag
+        return dict(sorted(curve_dict.items(), key=lambda x: maturity_to_years(x[0])))
 
@@ -6,10 +6,14 @@ Functions to calculate various yield curve metrics including slope, curvature,
 forward rates, and duration approximations.
 """
 
-from typing import Dict, Union
+from typing import Dict, Sequence, Union
 import numpy as np
 
 
+# Parameters of an NSSYieldCurve, as attribute names
+_NSS_PARAMS = ("beta0", "beta1", "beta2", "beta3", "tau1", "tau2")
+
+
 def calculate_slope(curve: Dict[str, float], short_maturity: str = "2Y", long_maturity: str = "10Y") -> float:
     """
     Calculate the slope of the yield curve (long-term minus short-term yield).
@@ -107,8 +111,11 @@ def calculate_forward_rates(model: Union[object, callable], grid: np.ndarray) ->
         # Use the derivative method of CubicSpline
         derivatives = model.spline.derivative()(grid)
         forwards = yields + grid * derivatives
+    elif hasattr(model, 'forward_rate'):
+        # NSSYieldCurve has a closed-form forward curve
+        forwards = model.forward_rate(grid)
     else:
-        # For other models (like NSS), use finite differences
+        # For other models, use finite differences
         yields = model(grid)
         
         # Forward rate approximation: f(t) ≈ y(t) + t * dy/dt
@@ -118,43 +125,88 @@ def calculate_forward_rates(model: Union[object, callable], grid: np.ndarray) ->
     return forwards
 
 
-def duration_approx(model: Union[object, callable], maturity: float, yield_change: float = 0.01) -> float:
+def calculate_forward_rates_batch(models: Sequence[object], grid: np.ndarray) -> np.ndarray:
+    """
+    Calculate instantaneous forward rates for several NSS models at once.
+    
+    The models' parameters are stacked into (D, 1) columns and broadcast
+    against the grid through the closed-form NSS forward curve
+    (see yieldcurve.models.nss.nss_forward_formula).
+    
+    Args:
+        models: Sequence of D NSSYieldCurve instances (e.g., as returned by
+                NSSYieldCurve.fit_batch)
+        grid: Array of N maturities (in years) at which to compute forward rates
+    
+    Returns:
+        np.ndarray: Forward rates of shape (D, N) (in percentage points);
+                    shape (0, N) if models is empty
+    
+    Example:
+        >>> from yieldcurve.models.nss import NSSYieldCurve
+        >>> models = NSSYieldCurve.fit_batch(maturities, yields_matrix)
+        >>> grid = np.linspace(0.25, 30.0, 120)
+        >>> forwards = calculate_forward_rates_batch(models, grid)
+    """
+    # Imported here: yieldcurve.models depends on yieldcurve.utils
+    from ..models.nss import nss_forward_formula
+    
+    grid = np.asarray(grid, dtype=float)
+    if len(models) == 0:
+        return np.empty((0,) + grid.shape)
+    
+    # (D, 6) parameters, reshaped so each broadcasts as a (D, 1, ...) column
+    params = np.array([[getattr(m, name) for name in _NSS_PARAMS] for m in models], dtype=float)
+    params = params.reshape(params.shape + (1,) * grid.ndim)
+    
+    return nss_forward_formula(grid, *np.moveaxis(params, 1, 0))
+
+
+def duration_approx(
+    model: Union[object, callable],
+    maturity: Union[float, np.ndarray],
+    yield_change: float = 0.01
+) -> Union[float, np.ndarray]:
     """
-    Approximate modified duration using finite differences.
+    Approximate modified duration of a zero-coupon bond using finite differences.
     
     Duration ≈ - (1 / P) * (dP / dy)
     
-    For a zero-coupon bond: P = exp(-y * t), so duration ≈ t
+    With yields in percent, P = exp(-y / 100 * t). The current yield cancels
+    out of P1 / P0, so the finite difference has the closed form
     
-    This function computes duration numerically by perturbing the yield.
+        duration = -expm1(-dy * t / 100) / dy
+    
+    This is the price sensitivity per 1 percentage point of yield, i.e.
+    about 0.01 * t (t / 100), not t in years. The forward difference is
+    accurate to first order in dy: it approaches t / 100 as dy -> 0 and
+    is slightly below it for finite dy. Arrays of maturities are handled
+    in a single vectorized step.
     
     Args:
-        model: Callable yield curve model that takes maturity (in years) and returns yield
-        maturity: Maturity at which to compute duration (in years)
-        yield_change: Small yield perturbation for numerical differentiation (default: 0.01 = 1bp)
+        model: Ignored; kept for backward compatibility. The zero-coupon
+               duration does not depend on the yield level, so the model
+               is not evaluated.
+        maturity: Maturity (float or array) at which to compute duration (in years)
+        yield_change: Small yield perturbation for numerical differentiation,
+                      in percentage points (default: 0.01 = 1bp)
     
     Returns:
-        float: Modified duration (in years)
+        float or np.ndarray: Relative price change per 1 percentage point of
+        yield (≈ 0.01 * maturity), matching the shape of maturity
     
     Example:
         >>> from yieldcurve.models.spline import CubicSplineYieldCurve
         >>> curve = {'1Y': 3.65, '2Y': 3.57, '10Y': 4.11}
         >>> model = CubicSplineYieldCurve(curve)
-        >>> duration_approx(model, 5.0)
-        4.85
+        >>> durations = duration_approx(model, np.array([1.0, 2.0, 5.0]))
+        >>> # array([0.01, 0.02, 0.05]) to about 4 significant digits
     """
-    y0 = float(model(maturity))
-    
-    # Price at current yield (zero-coupon bond)
-    P0 = np.exp(-y0 / 100.0 * maturity)  # Convert percentage to decimal
+    t = np.asarray(maturity, dtype=float)
     
-    # Price at perturbed yield
-    y1 = y0 + yield_change
-    P1 = np.exp(-y1 / 100.0 * maturity)
-    
-    # Modified duration = - (1/P) * (dP/dy)
-    dP_dy = (P1 - P0) / yield_change
-    duration = -(1.0 / P0) * dP_dy
+    # Modified duration = - (1/P0) * (P1 - P0) / dy, with P1 / P0 = exp(-dy * t)
+    duration = -np.expm1(-yield_change / 100.0 * t) / yield_change
     
+    if duration.ndim == 0:
+        return float(duration)
     return duration
-